@@ -13,17 +13,59 @@ Each is expected to be a JSON object with at least {"provider": ..., "config": {
 from __future__ import annotations
 
 import ast
-import hashlib
 import json
+import re
 import threading
+from collections import OrderedDict
 from typing import Any
 from urllib.parse import quote_plus
 
-from .constants import PGVECTOR_MAX_CONNECTIONS, PGVECTOR_MIN_CONNECTIONS
+from .constants import (
+    BUILT_CONFIG_CACHE_MAX_SIZE,
+    PGVECTOR_MAX_CONNECTIONS,
+    PGVECTOR_MIN_CONNECTIONS,
+)
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Code fence around a pasted block: drops the opening fence line (e.g. ```json)
+# and an optional closing fence line
+_FENCE_RE = re.compile(r"^```[^\n]*\n?(.*?)(?:\n[ \t]*```[^\n]*)?$", re.DOTALL)
+
+# Accepted string values for async_mode
+_ASYNC_MODE_TRUTHY = frozenset({"true", "1", "yes", "y", "on"})
+_ASYNC_MODE_FALSY = frozenset({"false", "0", "no", "n", "off"})
+
+# Discrete connection parameters, superseded by connection_string/connection_pool
+_PGVECTOR_INDIVIDUAL_KEYS = frozenset({"user", "password", "host", "port", "sslmode"})
+# Keys superseded by connection_pool (also the inputs folded into a built DSN)
+_PGVECTOR_POOL_OVERRIDDEN_KEYS = _PGVECTOR_INDIVIDUAL_KEYS | {"connection_string"}
+
+# Characters quote_plus never encodes; values made only of these need no quoting
+_URL_SAFE_RE = re.compile(r"[A-Za-z0-9._~-]*")
+
+# Valid pgvector config keys according to official documentation
+_PGVECTOR_VALID_KEYS = frozenset(
+    {
+        "dbname",
+        "collection_name",
+        "embedding_model_dims",
+        "user",
+        "password",
+        "host",
+        "port",
+        "diskann",
+        "hnsw",
+        "sslmode",
+        "connection_string",
+        "connection_pool",
+        "minconn",
+        "maxconn",
+        "metric",  # Additional key that may be used
+    },
+)
+
 
 def get_int_credential(
     credentials: dict[str, Any],
@@ -78,6 +120,27 @@ def get_int_credential(
     return value
 
 
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists into hashable tuples for cache keys.
+
+    Args:
+        obj: Value to freeze (typically the credentials dictionary).
+
+    Returns:
+        A hashable representation; dicts become sorted tuples of pairs.
+        Non-str values are tagged with their type so equal-comparing values
+        of different types (True/1, 5432/5432.0) don't share a key.
+
+    """
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, list):
+        return (list, tuple(_freeze(x) for x in obj))
+    return (type(obj), obj)
+
+
 def _raise_config_error(msg: str) -> None:
     """Raise a ValueError for configuration errors with logging.
 
@@ -101,14 +164,8 @@ def _parse_json_block(raw: str | dict[str, Any] | None, field_name: str) -> dict
         if text == "":
             return None
         # Strip code fences if user pasted with ```json ... ```
-        if text.startswith("```"):
-            lines = text.splitlines()
-            # Drop first fence line and possible trailing fence
-            if lines:
-                lines = lines[1:]
-            if lines and lines[-1].strip().startswith("```"):
-                lines = lines[:-1]
-            text = "\n".join(lines).strip()
+        if text.startswith("```") and (match := _FENCE_RE.match(text)):
+            text = match.group(1).strip()
 
         # First try strict JSON
         try:
@@ -134,56 +191,92 @@ def _parse_json_block(raw: str | dict[str, Any] | None, field_name: str) -> dict
         msg = f"{field_name} must include 'provider' and 'config' object"
         _raise_config_error(msg)
     logger.debug("Successfully parsed %s with provider: %s", field_name, provider)
+    if data is raw:
+        # Copy caller-owned blocks: the built config is normalized in place,
+        # cached and shared, so it must not alias the caller's credentials
+        data = {**data, "config": dict(cfg)}
     return data
 
 
-def _build_llm_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
-    """Build LLM config from individual form fields."""
-    provider = credentials.get("llm_provider")
-    if not provider:
+def _get_str(credentials: dict[str, Any], key: str) -> str | None:
+    """Read a credential as a stripped string, or None if missing/empty.
+
+    Truthy values are always returned stripped, so a whitespace-only value
+    yields "" (not None), matching the previous inline str(...).strip().
+    """
+    value = credentials.get(key)
+    if not value:
         return None
+    # Skip the str() round-trip for the common case of string inputs
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+def _fill_api_key(credentials: dict[str, Any], config: dict[str, Any], prefix: str) -> None:
+    """Fill api_key for providers that only need a key (openai, anthropic, cohere)."""
+    if (api_key := _get_str(credentials, f"{prefix}_api_key")) is not None:
+        config["api_key"] = api_key
+
+
+def _fill_azure_kwargs(credentials: dict[str, Any], config: dict[str, Any], prefix: str) -> None:
+    """Fill azure_kwargs for Azure OpenAI from the {prefix}_* form fields."""
+    azure_kwargs: dict[str, Any] = {}
+    if (api_key := _get_str(credentials, f"{prefix}_api_key")) is not None:
+        azure_kwargs["api_key"] = api_key
+    if (endpoint := _get_str(credentials, f"{prefix}_azure_endpoint")) is not None:
+        azure_kwargs["azure_endpoint"] = endpoint
+    if (deployment := _get_str(credentials, f"{prefix}_azure_deployment")) is not None:
+        azure_kwargs["azure_deployment"] = deployment
+    azure_kwargs["api_version"] = "2024-10-21"  # Default
+    config["azure_kwargs"] = azure_kwargs
+
+
+# Provider-specific field builders, keyed by provider name.
+# Providers not listed here only use the common fields (model, etc.).
+_LLM_FIELD_BUILDERS = {
+    "openai": _fill_api_key,
+    "azure_openai": _fill_azure_kwargs,
+    "anthropic": _fill_api_key,
+}
+# HuggingFace doesn't need API key for local models
+_EMBEDDER_FIELD_BUILDERS = {
+    "openai": _fill_api_key,
+    "azure_openai": _fill_azure_kwargs,
+}
+# HuggingFace and Sentence Transformer don't need API key for local models;
+# optional device, batch_size, max_length can be added if needed
+_RERANKER_FIELD_BUILDERS = {
+    "cohere": _fill_api_key,
+}
 
-    provider = str(provider).strip()
+
+def _build_llm_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
+    """Build LLM config from individual form fields."""
+    provider = _get_str(credentials, "llm_provider")
     if not provider:
         return None
 
     config: dict[str, Any] = {}
     
     # Common fields
-    if credentials.get("llm_model"):
-        config["model"] = str(credentials.get("llm_model")).strip()
-    if credentials.get("llm_temperature"):
+    if (model := _get_str(credentials, "llm_model")) is not None:
+        config["model"] = model
+    if temperature := credentials.get("llm_temperature"):
         try:
-            config["temperature"] = float(credentials.get("llm_temperature", "0.1"))
+            config["temperature"] = float(temperature)
         except (ValueError, TypeError):
             config["temperature"] = 0.1
-    if credentials.get("llm_max_tokens"):
+    if max_tokens := credentials.get("llm_max_tokens"):
         try:
-            config["max_tokens"] = int(credentials.get("llm_max_tokens", "256"))
+            config["max_tokens"] = int(max_tokens)
         except (ValueError, TypeError):
             config["max_tokens"] = 256
 
     # Provider-specific fields
-    if provider == "openai":
-        api_key = credentials.get("llm_api_key")
-        if api_key:
-            config["api_key"] = str(api_key).strip()
-    elif provider == "azure_openai":
-        azure_kwargs: dict[str, Any] = {}
-        if credentials.get("llm_api_key"):
-            azure_kwargs["api_key"] = str(credentials.get("llm_api_key")).strip()
-        if credentials.get("llm_azure_endpoint"):
-            azure_kwargs["azure_endpoint"] = str(credentials.get("llm_azure_endpoint")).strip()
-        if credentials.get("llm_azure_deployment"):
-            azure_kwargs["azure_deployment"] = str(credentials.get("llm_azure_deployment")).strip()
-        azure_kwargs["api_version"] = "2024-10-21"  # Default
-        if azure_kwargs:
-            config["azure_kwargs"] = azure_kwargs
-    elif provider == "anthropic":
-        api_key = credentials.get("llm_api_key")
-        if api_key:
-            config["api_key"] = str(api_key).strip()
-    # Support other providers (they will use common fields like model, temperature, etc.)
+    # Other providers use common fields like model, temperature, etc.
+    if builder := _LLM_FIELD_BUILDERS.get(provider):
+        builder(credentials, config, "llm")
 
     if not config or "model" not in config:
         return None
@@ -193,39 +286,19 @@ def _build_llm_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None
 
 def _build_embedder_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
     """Build embedder config from individual form fields."""
-    provider = credentials.get("embedder_provider")
-    if not provider:
-        return None
-
-    provider = str(provider).strip()
+    provider = _get_str(credentials, "embedder_provider")
     if not provider:
         return None
 
     config: dict[str, Any] = {}
     
     # Common fields
-    if credentials.get("embedder_model"):
-        config["model"] = str(credentials.get("embedder_model")).strip()
+    if (model := _get_str(credentials, "embedder_model")) is not None:
+        config["model"] = model
 
     # Provider-specific fields
-    if provider == "openai":
-        api_key = credentials.get("embedder_api_key")
-        if api_key:
-            config["api_key"] = str(api_key).strip()
-    elif provider == "azure_openai":
-        azure_kwargs: dict[str, Any] = {}
-        if credentials.get("embedder_api_key"):
-            azure_kwargs["api_key"] = str(credentials.get("embedder_api_key")).strip()
-        if credentials.get("embedder_azure_endpoint"):
-            azure_kwargs["azure_endpoint"] = str(credentials.get("embedder_azure_endpoint")).strip()
-        if credentials.get("embedder_azure_deployment"):
-            azure_kwargs["azure_deployment"] = str(credentials.get("embedder_azure_deployment")).strip()
-        azure_kwargs["api_version"] = "2024-10-21"  # Default
-        if azure_kwargs:
-            config["azure_kwargs"] = azure_kwargs
-    elif provider == "huggingface":
-        # HuggingFace doesn't need API key for local models
-        pass
+    if builder := _EMBEDDER_FIELD_BUILDERS.get(provider):
+        builder(credentials, config, "embedder")
 
     if not config or "model" not in config:
         return None
@@ -235,36 +308,29 @@ def _build_embedder_from_fields(credentials: dict[str, Any]) -> dict[str, Any] |
 
 def _build_vector_db_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
     """Build vector DB config from individual form fields."""
-    provider = credentials.get("vector_db_provider")
-    if not provider:
+    provider = _get_str(credentials, "vector_db_provider")
+    if provider is None:
         provider = "pgvector"  # Default
-    
-    provider = str(provider).strip()
     if provider != "pgvector":
         return None
 
     config: dict[str, Any] = {}
     
     # Required fields
-    if credentials.get("vector_db_host"):
-        config["host"] = str(credentials.get("vector_db_host")).strip()
-    if credentials.get("vector_db_name"):
-        config["dbname"] = str(credentials.get("vector_db_name")).strip()
-    if credentials.get("vector_db_user"):
-        config["user"] = str(credentials.get("vector_db_user")).strip()
-    if credentials.get("vector_db_password"):
-        config["password"] = str(credentials.get("vector_db_password")).strip()
+    if (host := _get_str(credentials, "vector_db_host")) is not None:
+        config["host"] = host
+    if (dbname := _get_str(credentials, "vector_db_name")) is not None:
+        config["dbname"] = dbname
+    if (user := _get_str(credentials, "vector_db_user")) is not None:
+        config["user"] = user
+    if (password := _get_str(credentials, "vector_db_password")) is not None:
+        config["password"] = password
     
     # Optional fields
-    if credentials.get("vector_db_port"):
-        config["port"] = str(credentials.get("vector_db_port")).strip()
-    else:
-        config["port"] = "5432"
-    
-    if credentials.get("vector_db_sslmode"):
-        config["sslmode"] = str(credentials.get("vector_db_sslmode")).strip()
-    else:
-        config["sslmode"] = "disable"
+    port = _get_str(credentials, "vector_db_port")
+    config["port"] = port if port is not None else "5432"
+    sslmode = _get_str(credentials, "vector_db_sslmode")
+    config["sslmode"] = sslmode if sslmode is not None else "disable"
 
     if not config or not config.get("user"):
         return None
@@ -274,29 +340,23 @@ def _build_vector_db_from_fields(credentials: dict[str, Any]) -> dict[str, Any]
 
 def _build_graph_db_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
     """Build graph DB config from individual form fields."""
-    provider = credentials.get("graph_db_provider")
-    if not provider:
-        return None
-
-    provider = str(provider).strip()
+    provider = _get_str(credentials, "graph_db_provider")
     if not provider:
         return None
 
     config: dict[str, Any] = {}
     
     # Required fields
-    if credentials.get("graph_db_url"):
-        config["url"] = str(credentials.get("graph_db_url")).strip()
-    if credentials.get("graph_db_username"):
-        config["username"] = str(credentials.get("graph_db_username")).strip()
-    if credentials.get("graph_db_password"):
-        config["password"] = str(credentials.get("graph_db_password")).strip()
+    if (url := _get_str(credentials, "graph_db_url")) is not None:
+        config["url"] = url
+    if (username := _get_str(credentials, "graph_db_username")) is not None:
+        config["username"] = username
+    if (password := _get_str(credentials, "graph_db_password")) is not None:
+        config["password"] = password
     
     # Optional fields
-    if credentials.get("graph_db_database"):
-        config["database"] = str(credentials.get("graph_db_database")).strip()
-    else:
-        config["database"] = "neo4j"
+    database = _get_str(credentials, "graph_db_database")
+    config["database"] = database if database is not None else "neo4j"
 
     if not config or not config.get("url"):
         return None
@@ -306,40 +366,27 @@ def _build_graph_db_from_fields(credentials: dict[str, Any]) -> dict[str, Any] |
 
 def _build_reranker_from_fields(credentials: dict[str, Any]) -> dict[str, Any] | None:
     """Build reranker config from individual form fields."""
-    provider = credentials.get("reranker_provider")
-    if not provider:
-        return None
-
-    provider = str(provider).strip()
+    provider = _get_str(credentials, "reranker_provider")
     if not provider:
         return None
 
     config: dict[str, Any] = {}
     
     # Common fields
-    if credentials.get("reranker_model"):
-        config["model"] = str(credentials.get("reranker_model")).strip()
+    if (model := _get_str(credentials, "reranker_model")) is not None:
+        config["model"] = model
     
-    if credentials.get("reranker_top_k"):
+    if (top_k := _get_str(credentials, "reranker_top_k")) is not None:
         try:
-            config["top_k"] = int(str(credentials.get("reranker_top_k")).strip())
+            config["top_k"] = int(top_k)
         except (TypeError, ValueError):
             config["top_k"] = 5  # Default
     else:
         config["top_k"] = 5
 
     # Provider-specific fields
-    if provider == "cohere":
-        api_key = credentials.get("reranker_api_key")
-        if api_key:
-            config["api_key"] = str(api_key).strip()
-    elif provider == "huggingface":
-        # HuggingFace doesn't need API key for local models
-        # Optional device, batch_size, max_length can be added if needed
-        pass
-    elif provider == "sentence_transformer":
-        # Sentence Transformer doesn't need API key for local models
-        pass
+    if builder := _RERANKER_FIELD_BUILDERS.get(provider):
+        builder(credentials, config, "reranker")
 
     if not config or "model" not in config:
         return None
@@ -347,6 +394,68 @@ def _build_reranker_from_fields(credentials: dict[str, Any]) -> dict[str, Any] |
     return {"provider": provider, "config": config}
 
 
+def _quote_plus_fast(value: str) -> str:
+    """quote_plus() that skips encoding for values that are already URL-safe."""
+    return value if _URL_SAFE_RE.fullmatch(value) else quote_plus(value)
+
+
+def _copy_pgvector_keys(
+    config: dict[str, Any],
+    excluded: frozenset[str],
+) -> dict[str, Any]:
+    """Copy valid, non-None pgvector keys from config, skipping excluded ones."""
+    return {
+        key: value
+        for key, value in config.items()
+        if key in _PGVECTOR_VALID_KEYS and key not in excluded and value is not None
+    }
+
+
+def _normalize_pgvector_pool(config: dict[str, Any]) -> dict[str, Any]:
+    """Keep connection_pool; drop connection_string and individual parameters."""
+    logger.debug("Using connection_pool (highest priority)")
+    # dbname may still be needed for some operations, keep it if provided
+    return _copy_pgvector_keys(config, _PGVECTOR_POOL_OVERRIDDEN_KEYS)
+
+
+def _normalize_pgvector_dsn(config: dict[str, Any]) -> dict[str, Any]:
+    """Keep connection_string; drop individual connection parameters."""
+    logger.debug("Using connection_string (second priority)")
+    # dbname is included in connection_string, but keep it if explicitly provided
+    # for compatibility (Mem0 may use it for some operations)
+    return _copy_pgvector_keys(config, _PGVECTOR_INDIVIDUAL_KEYS)
+
+
+def _normalize_pgvector_params(config: dict[str, Any]) -> dict[str, Any] | None:
+    """Build connection_string from individual parameters.
+
+    Returns None if user is missing, so the caller can pass config through.
+    """
+    user = config.get("user") or ""
+    if not user:
+        return None
+
+    dbname = config.get("dbname") or "postgres"
+    password = config.get("password") or ""
+    host = config.get("host") or "localhost"
+    port = str(config.get("port") or "5432")
+    sslmode = config.get("sslmode")  # e.g., "disable" | "require"
+
+    user_enc = _quote_plus_fast(str(user))
+    pwd_enc = _quote_plus_fast(str(password))
+    # psycopg2 accepts postgresql:// URI; do NOT include '+psycopg2'
+    dsn = f"postgresql://{user_enc}:{pwd_enc}@{host}:{port}/{dbname}"
+    if sslmode:
+        dsn = f"{dsn}?sslmode={_quote_plus_fast(str(sslmode))}"
+
+    # Individual connection parameters are now in connection_string;
+    # keep dbname as it may be used for some operations
+    normalized = _copy_pgvector_keys(config, _PGVECTOR_POOL_OVERRIDDEN_KEYS)
+    normalized["connection_string"] = dsn
+    logger.debug("Built connection_string from individual parameters")
+    return normalized
+
+
 def _normalize_pgvector_config(
     config: dict[str, Any],
     min_connections: int,
@@ -365,104 +474,32 @@ def _normalize_pgvector_config(
 
     Reference: Mem0 pgvector configuration documentation
     """
-    normalized: dict[str, Any] = {}
-
-    # Valid pgvector config keys according to official documentation
-    valid_keys = (
-        "dbname",
-        "collection_name",
-        "embedding_model_dims",
-        "user",
-        "password",
-        "host",
-        "port",
-        "diskann",
-        "hnsw",
-        "sslmode",
-        "connection_string",
-        "connection_pool",
-        "minconn",
-        "maxconn",
-        "metric",  # Additional key that may be used
-    )
-
-    # Preserve all valid keys from config
-    for key in valid_keys:
-        if key in config and config[key] is not None:
-            normalized[key] = config[key]
-
-    # Handle connection parameters according to priority:
-    # 1. connection_pool (highest priority) - overrides everything
-    if "connection_pool" in normalized:
-        logger.debug("Using connection_pool (highest priority)")
-        # Remove connection_string and individual connection parameters
-        # as connection_pool overrides them
-        normalized.pop("connection_string", None)
-        normalized.pop("user", None)
-        normalized.pop("password", None)
-        normalized.pop("host", None)
-        normalized.pop("port", None)
-        normalized.pop("sslmode", None)
-        # dbname may still be needed for some operations, keep it if provided
-    # 2. connection_string (second priority) - overrides individual parameters
-    elif "connection_string" in normalized and isinstance(
-        normalized["connection_string"], str,
-    ):
-        logger.debug("Using connection_string (second priority)")
-        # Remove individual connection parameters as connection_string overrides them
-        normalized.pop("user", None)
-        normalized.pop("password", None)
-        normalized.pop("host", None)
-        normalized.pop("port", None)
-        normalized.pop("sslmode", None)
-        # dbname is included in connection_string, but keep it if explicitly provided
-        # for compatibility (Mem0 may use it for some operations)
-    # 3. Individual parameters (lowest priority) - build connection_string
+    # Handle connection parameters according to priority; each path builds
+    # the normalized dict directly from config.
+    if config.get("connection_pool") is not None:
+        normalized = _normalize_pgvector_pool(config)
+    elif isinstance(config.get("connection_string"), str):
+        normalized = _normalize_pgvector_dsn(config)
     else:
-        # Extract connection parameters
-        dbname = normalized.get("dbname") or normalized.get("database") or "postgres"
-        user = normalized.get("user") or ""
-        password = normalized.get("password") or ""
-        host = normalized.get("host") or "localhost"
-        port = str(normalized.get("port") or "5432")
-        sslmode = normalized.get("sslmode")  # e.g., "disable" | "require"
-
-        if not user:
+        params = _normalize_pgvector_params(config)
+        if params is None:
             # If user is not provided, return as-is; Mem0 may handle other forms.
             logger.warning(
                 "Insufficient pgvector connection parameters (user is required)",
             )
             return config
-
-        # Build connection_string from individual parameters
-        user_enc = quote_plus(str(user))
-        pwd_enc = quote_plus(str(password))
-        # psycopg2 accepts postgresql:// URI; do NOT include '+psycopg2'
-        dsn = f"postgresql://{user_enc}:{pwd_enc}@{host}:{port}/{dbname}"
-        if sslmode:
-            dsn = f"{dsn}?sslmode={quote_plus(str(sslmode))}"
-
-        normalized["connection_string"] = dsn
-        logger.debug("Built connection_string from individual parameters")
-
-        # Remove individual connection parameters as they're now in connection_string
-        normalized.pop("user", None)
-        normalized.pop("password", None)
-        normalized.pop("host", None)
-        normalized.pop("port", None)
-        normalized.pop("sslmode", None)
-        # Keep dbname as it may be used for some operations
+        normalized = params
 
     # Set connection pool settings if not already provided
     # Use provided values (typically from credentials, falling back to constants)
     # to ensure sufficient connections for concurrent operations.
-    if "minconn" not in normalized or normalized.get("minconn") is None:
+    if "minconn" not in normalized:
         normalized["minconn"] = min_connections
         logger.debug(
             "Setting pgvector minconn to: %d",
             min_connections,
         )
-    if "maxconn" not in normalized or normalized.get("maxconn") is None:
+    if "maxconn" not in normalized:
         normalized["maxconn"] = max_connections
         logger.debug(
             "Setting pgvector maxconn to: %d",
@@ -473,10 +510,121 @@ def _normalize_pgvector_config(
 
 
 # Cache for built configurations to avoid redundant logging
-_built_config_cache: dict[str, dict[str, Any]] = {}
+# LRU bounded to BUILT_CONFIG_CACHE_MAX_SIZE entries; hits move to the end and
+# the least recently used entry is evicted first
+_built_config_cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
 _build_config_lock = threading.Lock()
 
 
+def _build_config(credentials: dict[str, Any]) -> dict[str, Any]:
+    """Build a fresh mem0 local config dict without consulting the cache."""
+    logger.info("Building Mem0 local configuration from credentials")
+
+    # Read optional pgvector pool settings from credentials, with safe defaults.
+    # If users do not configure these fields, PGVECTOR_MIN_CONNECTIONS /
+    # PGVECTOR_MAX_CONNECTIONS from utils/constants.py are used.
+    pg_min_connections = get_int_credential(
+        credentials,
+        "pgvector_min_connections",
+        PGVECTOR_MIN_CONNECTIONS,
+    )
+    pg_max_connections = get_int_credential(
+        credentials,
+        "pgvector_max_connections",
+        PGVECTOR_MAX_CONNECTIONS,
+    )
+
+    # ========== LLM Configuration ==========
+    # Priority: JSON > Form fields (backward compatible)
+    llm = _parse_json_block(credentials.get("local_llm_json"), "local_llm_json")
+    if not llm:
+        # Try to build from form fields
+        llm = _build_llm_from_fields(credentials)
+        if llm:
+            logger.debug("Built LLM config from form fields")
+
+    if llm is None:
+        msg = "LLM configuration is required. Provide either 'local_llm_json' or form fields (llm_provider + llm_model)"
+        _raise_config_error(msg)
+
+    # ========== Embedder Configuration ==========
+    # Priority: JSON > Form fields (backward compatible)
+    embedder = _parse_json_block(credentials.get("local_embedder_json"), "local_embedder_json")
+    if not embedder:
+        # Try to build from form fields
+        embedder = _build_embedder_from_fields(credentials)
+        if embedder:
+            logger.debug("Built embedder config from form fields")
+
+    if embedder is None:
+        msg = "Embedder configuration is required. Provide either 'local_embedder_json' or form fields (embedder_provider + embedder_model)"
+        _raise_config_error(msg)
+
+    # ========== Vector Database Configuration ==========
+    # Priority: JSON > Form fields (backward compatible)
+    vector_store = _parse_json_block(
+        credentials.get("local_vector_db_json"), "local_vector_db_json",
+    )
+    if not vector_store:
+        # Try to build from form fields
+        vector_store = _build_vector_db_from_fields(credentials)
+        if vector_store:
+            logger.debug("Built vector DB config from form fields")
+
+    if vector_store is None:
+        msg = "Vector Database configuration is required. Provide either 'local_vector_db_json' or form fields (vector_db_provider + vector_db_*)"
+        _raise_config_error(msg)
+
+    # Normalize pgvector config shape if necessary
+    if (
+        vector_store.get("provider") == "pgvector"
+        and isinstance(vector_store.get("config"), dict)
+    ):
+        logger.debug("Normalizing pgvector configuration")
+        vector_store["config"] = _normalize_pgvector_config(
+            vector_store["config"],
+            pg_min_connections,
+            pg_max_connections,
+        )  # type: ignore[index]
+
+    # ========== Reranker Configuration (Optional) ==========
+    # Priority: JSON > Form fields (backward compatible)
+    reranker = _parse_json_block(
+        credentials.get("local_reranker_json"), "local_reranker_json",
+    )
+    if not reranker:
+        # Try to build from form fields
+        reranker = _build_reranker_from_fields(credentials)
+        if reranker:
+            logger.debug("Built reranker config from form fields")
+
+    # ========== Graph Database Configuration (Optional) ==========
+    # Priority: JSON > Form fields (backward compatible)
+    graph_store = _parse_json_block(
+        credentials.get("local_graph_db_json"), "local_graph_db_json",
+    )
+    if not graph_store:
+        # Try to build from form fields
+        graph_store = _build_graph_db_from_fields(credentials)
+        if graph_store:
+            logger.debug("Built graph DB config from form fields")
+
+    config: dict[str, Any] = {
+        "llm": llm,
+        "embedder": embedder,
+        "vector_store": vector_store,
+    }
+    if reranker:
+        config["reranker"] = reranker
+        logger.debug("Reranker configuration included")
+    if graph_store:
+        config["graph_store"] = graph_store
+        logger.debug("Graph store configuration included")
+
+    logger.info("Mem0 local configuration built successfully")
+    return config
+
+
 def build_local_mem0_config(credentials: dict[str, Any]) -> dict[str, Any]:
     """Construct mem0 local config dict from simplified JSON credential blocks.
 
@@ -484,133 +632,39 @@ def build_local_mem0_config(credentials: dict[str, Any]) -> dict[str, Any]:
     Optional: local_reranker_json, local_graph_db_json
     """
     # Create a cache key from credentials to detect if config was already built
+    cache_key: tuple[Any, ...] | None
     try:
-        cred_str = json.dumps(credentials, sort_keys=True)
-        cache_key = hashlib.md5(cred_str.encode()).hexdigest()  # noqa: S324
-    except Exception:  # noqa: BLE001
-        # If serialization fails, don't cache
+        cache_key = _freeze(credentials)
+        hash(cache_key)
+    except TypeError:
+        # Unhashable or unsortable values, don't cache
         cache_key = None
 
-    # Check cache first
-    if cache_key and cache_key in _built_config_cache:
-        return _built_config_cache[cache_key]
+    if cache_key is None:
+        return _build_config(credentials)
 
-    # Build new config
+    # Check cache first; refresh recency under the lock so a concurrent
+    # eviction can't remove the key between lookup and move_to_end
     with _build_config_lock:
-        # Double-check after acquiring lock
-        if cache_key and cache_key in _built_config_cache:
-            return _built_config_cache[cache_key]
-
-        logger.info("Building Mem0 local configuration from credentials")
-
-        # Read optional pgvector pool settings from credentials, with safe defaults.
-        # If users do not configure these fields, PGVECTOR_MIN_CONNECTIONS /
-        # PGVECTOR_MAX_CONNECTIONS from utils/constants.py are used.
-        pg_min_connections = get_int_credential(
-            credentials,
-            "pgvector_min_connections",
-            PGVECTOR_MIN_CONNECTIONS,
-        )
-        pg_max_connections = get_int_credential(
-            credentials,
-            "pgvector_max_connections",
-            PGVECTOR_MAX_CONNECTIONS,
-        )
-        
-        # ========== LLM Configuration ==========
-        # Priority: JSON > Form fields (backward compatible)
-        llm = _parse_json_block(credentials.get("local_llm_json"), "local_llm_json")
-        if not llm:
-            # Try to build from form fields
-            llm = _build_llm_from_fields(credentials)
-            if llm:
-                logger.debug("Built LLM config from form fields")
-        
-        if llm is None:
-            msg = "LLM configuration is required. Provide either 'local_llm_json' or form fields (llm_provider + llm_model)"
-            _raise_config_error(msg)
-        
-        # ========== Embedder Configuration ==========
-        # Priority: JSON > Form fields (backward compatible)
-        embedder = _parse_json_block(credentials.get("local_embedder_json"), "local_embedder_json")
-        if not embedder:
-            # Try to build from form fields
-            embedder = _build_embedder_from_fields(credentials)
-            if embedder:
-                logger.debug("Built embedder config from form fields")
-        
-        if embedder is None:
-            msg = "Embedder configuration is required. Provide either 'local_embedder_json' or form fields (embedder_provider + embedder_model)"
-            _raise_config_error(msg)
-        
-        # ========== Vector Database Configuration ==========
-        # Priority: JSON > Form fields (backward compatible)
-        vector_store = _parse_json_block(
-            credentials.get("local_vector_db_json"), "local_vector_db_json",
-        )
-        if not vector_store:
-            # Try to build from form fields
-            vector_store = _build_vector_db_from_fields(credentials)
-            if vector_store:
-                logger.debug("Built vector DB config from form fields")
-        
-        if vector_store is None:
-            msg = "Vector Database configuration is required. Provide either 'local_vector_db_json' or form fields (vector_db_provider + vector_db_*)"
-            _raise_config_error(msg)
-
-        # Normalize pgvector config shape if necessary
-        if (
-            vector_store.get("provider") == "pgvector"
-            and isinstance(vector_store.get("config"), dict)
-        ):
-            logger.debug("Normalizing pgvector configuration")
-            vector_store["config"] = _normalize_pgvector_config(
-                vector_store["config"],
-                pg_min_connections,
-                pg_max_connections,
-            )  # type: ignore[index]
-
-        # ========== Reranker Configuration (Optional) ==========
-        # Priority: JSON > Form fields (backward compatible)
-        reranker = _parse_json_block(
-            credentials.get("local_reranker_json"), "local_reranker_json",
-        )
-        if not reranker:
-            # Try to build from form fields
-            reranker = _build_reranker_from_fields(credentials)
-            if reranker:
-                logger.debug("Built reranker config from form fields")
-        
-        # ========== Graph Database Configuration (Optional) ==========
-        # Priority: JSON > Form fields (backward compatible)
-        graph_store = _parse_json_block(
-            credentials.get("local_graph_db_json"), "local_graph_db_json",
-        )
-        if not graph_store:
-            # Try to build from form fields
-            graph_store = _build_graph_db_from_fields(credentials)
-            if graph_store:
-                logger.debug("Built graph DB config from form fields")
-
-        config: dict[str, Any] = {
-            "llm": llm,
-            "embedder": embedder,
-            "vector_store": vector_store,
-        }
-        if reranker:
-            config["reranker"] = reranker
-            logger.debug("Reranker configuration included")
-        if graph_store:
-            config["graph_store"] = graph_store
-            logger.debug("Graph store configuration included")
-
-        logger.info("Mem0 local configuration built successfully")
-
-        # Cache the config if we have a valid cache key
-        if cache_key:
-            _built_config_cache[cache_key] = config
+        cached = _built_config_cache.get(cache_key)
+        if cached is not None:
+            _built_config_cache.move_to_end(cache_key)
+            return cached
+
+    # Build outside the lock so distinct credentials don't serialize each other;
+    # the lock only guards cache access.
+    config = _build_config(credentials)
+    with _build_config_lock:
+        # A concurrent build of the same credentials may have won the race
+        cached = _built_config_cache.get(cache_key)
+        if cached is not None:
+            _built_config_cache.move_to_end(cache_key)
+            return cached
+        if len(_built_config_cache) >= BUILT_CONFIG_CACHE_MAX_SIZE:
+            _built_config_cache.popitem(last=False)
+        _built_config_cache[cache_key] = config
 
-        return config
+    return config
 
 
 def is_async_mode(credentials: dict[str, Any]) -> bool:
@@ -623,9 +677,9 @@ def is_async_mode(credentials: dict[str, Any]) -> bool:
         return value
     if isinstance(value, str):
         text = value.strip().lower()
-        if text in {"true", "1", "yes", "y", "on"}:
+        if text in _ASYNC_MODE_TRUTHY:
             return True
-        if text in {"false", "0", "no", "n", "off"}:
+        if text in _ASYNC_MODE_FALSY:
             return False
     # Default: async enabled
     return True
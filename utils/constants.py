@@ -60,6 +60,9 @@ PGVECTOR_MIN_CONNECTIONS: int = 10  # Minimum number of connections in the pool
 # Maximum number of connections in the pool (should match MAX_CONCURRENT_MEMORY_OPERATIONS)
 PGVECTOR_MAX_CONNECTIONS: int = 40
 
+# Maximum number of built local configs kept in the LRU cache (one per distinct credentials set)
+BUILT_CONFIG_CACHE_MAX_SIZE: int = 256
+
 # Default top_k for search
 SEARCH_DEFAULT_TOP_K: int = 5
 
@@ -60,10 +60,8 @@ def parse_iso_timestamp(value: object) -> datetime | None:
     if not normalized:
         return None
 
-    # Convert 'Z' suffix to '+00:00' for fromisoformat compatibility
-    if normalized.endswith("Z"):
-        normalized = normalized[:-1] + "+00:00"
-
+    # Python 3.11+ fromisoformat parses all supported shapes, including a
+    # trailing 'Z', directly in C; no pre-processing is needed.
     try:
         dt = datetime.fromisoformat(normalized)
     except ValueError:
@@ -98,6 +96,7 @@ def format_recent_timestamp(created_at: object, updated_at: object) -> str:
     if not candidates:
         return ""
 
-    latest = max(candidates, key=lambda dt: dt.timestamp())
+    # Aware datetimes compare directly; no need to convert via timestamp()
+    latest = max(candidates)
     return latest.astimezone().strftime("%Y-%m-%dT%H:%M:%S")
 